@@ -21,7 +21,7 @@ import re
 import datetime as dt
 import random
 import string
-from functools import lru_cache
+from functools import lru_cache, partial
 
 
 class Parser(object):
@@ -42,7 +42,42 @@ class Parser(object):
         '''Parse keys and corresponding values from *stri* using format
         described in *fmt* string.
         '''
-        return parse(self.fmt, stri, full_match=full_match)
+        keyvals = _match(_compile_regex(self.fmt, full_match), _get_converters(self.fmt), stri)
+        if keyvals is None:
+            raise _no_match_error(self.fmt, stri)
+        return keyvals
+
+    def parse_many(self, strings, full_match=True, columnar=False):
+        """Parse keys and corresponding values from each string in *strings*.
+
+        Args:
+            strings (iterable): Strings to parse
+            full_match (bool): Force the match of the whole strings. Default
+                True.
+            columnar (bool): If True, return the values as a dict of lists
+                (one list per key) instead of a list of dicts. Default False.
+
+        Returns:
+            list or dict: The parsed values for each string.
+
+        """
+        regex = _compile_regex(self.fmt, full_match)
+        converters = _get_converters(self.fmt)
+        if columnar:
+            results = {key: [] for key in regex.groupindex}
+            appenders = [(key, values.append) for key, values in results.items()]
+        else:
+            results = []
+        for stri in strings:
+            keyvals = _match(regex, converters, stri)
+            if keyvals is None:
+                raise _no_match_error(self.fmt, stri)
+            if columnar:
+                for key, append in appenders:
+                    append(keyvals[key])
+            else:
+                results.append(keyvals)
+        return results
 
     def compose(self, keyvals, allow_partial=False):
         """Compose format string *self.fmt* with parameters given in the *keyvals* dict.
@@ -69,14 +104,17 @@ class Parser(object):
         '''
         return globify(self.fmt, keyvals)
 
-    def validate(self, stri):
+    def validate(self, stri, strict=True):
         """
         Validates that string *stri* is parsable and therefore complies with
         this string format definition.  Useful for filtering strings, or to
         check if a string if compatible before passing it to the
         parser function.
+
+        If *strict* is False, only the structure of *stri* is checked and
+        the values are not converted (e.g. to datetime objects).
         """
-        return validate(self.fmt, stri)
+        return validate(self.fmt, stri, strict=strict)
 
     def is_one2one(self):
         """
@@ -127,18 +165,20 @@ class StringFormatter(string.Formatter):
         't': 'title',
         'u': 'upper'
     }
+    SEPARATOR_REMOVING_CONVS = frozenset('hHR')
+    SEPARATOR_REMOVAL_TABLE = str.maketrans('', '', '-_: ')
 
     def convert_field(self, value, conversion):
         """Apply conversions mentioned above."""
         func = self.CONV_FUNCS.get(conversion)
         if func is not None:
             value = getattr(value, func)()
-        elif conversion not in ['R']:
+        elif conversion != 'R':
             # default conversion ('r', 's')
             return super(StringFormatter, self).convert_field(value, conversion)
 
-        if conversion in ['h', 'H', 'R']:
-            value = value.replace('-', '').replace('_', '').replace(':', '').replace(' ', '')
+        if conversion in self.SEPARATOR_REMOVING_CONVS:
+            value = value.translate(self.SEPARATOR_REMOVAL_TABLE)
         return value
 
 
@@ -177,6 +217,7 @@ fixed_point_types = ['f', 'e', 'E', 'g']
 fmt_spec_regex = re.compile(
     r'(?P<align>(?P<fill>.)?[<>=^])?(?P<sign>[\+\-\s])?(?P<pound>#)?(?P<zero>0)?(?P<width>\d+)?'
     r'(?P<comma>,)?(?P<precision>.\d+)?(?P<type>[bcdeEfFgGnosxX%]?)')
+digits_regex = re.compile(r'[0-9]+')
 
 
 def _get_fixed_point_regex(regex_dict, width, precision):
@@ -229,6 +270,7 @@ class RegexFormatter(string.Formatter):
     UNPROVIDED_VALUE = '<trollsift unprovided value>'
     ESCAPE_CHARACTERS = ['\\'] + [x for x in string.punctuation if x not in '\\%']
     ESCAPE_SETS = [(c, '\\' + c) for c in ESCAPE_CHARACTERS]
+    ESCAPE_TABLE = str.maketrans(dict(ESCAPE_SETS))
 
     def __init__(self):
         # hold on to fields we've seen already so we can reuse their
@@ -236,8 +278,9 @@ class RegexFormatter(string.Formatter):
         self._cached_fields = {}
         super(RegexFormatter, self).__init__()
 
-    @lru_cache()
     def format(*args, **kwargs):
+        # Results are memoized per format string by `regex_format`, which
+        # uses a fresh formatter for each call, so no caching is done here.
         try:
             # super() doesn't seem to work here
             ret_val = string.Formatter.format(*args, **kwargs)
@@ -252,9 +295,7 @@ class RegexFormatter(string.Formatter):
         Similar to `re.escape` but allows '%' to pass through.
 
         """
-        for ch, r_ch in self.ESCAPE_SETS:
-            s = s.replace(ch, r_ch)
-        return s
+        return s.translate(self.ESCAPE_TABLE)
 
     def parse(self, format_string):
         parse_ret = super(RegexFormatter, self).parse(format_string)
@@ -272,17 +313,7 @@ class RegexFormatter(string.Formatter):
             return key, self.UNPROVIDED_VALUE
 
     def _regex_datetime(self, format_spec):
-        replace_str = format_spec
-        for fmt_key, fmt_val in DT_FMT.items():
-            if fmt_key == '%%':
-                # special case
-                replace_str.replace('%%', '%')
-                continue
-            count = fmt_val.count('?')
-            # either a series of numbers or letters/numbers
-            regex = r'\d{{{:d}}}'.format(count) if count else r'[^ \t\n\r\f\v\-_:]+'
-            replace_str = replace_str.replace(fmt_key, regex)
-        return replace_str
+        return dt_directive_regex.sub(_dt_directive_to_regex, format_spec)
 
     @staticmethod
     def format_spec_to_regex(field_name, format_spec):
@@ -372,15 +403,50 @@ def extract_values(fmt, stri, full_match=True):
         full_match (bool): Force the match of the whole string. Default
             to ``True``.
     """
+    keyvals = _match(_compile_regex(fmt, full_match), (), stri)
+    if keyvals is None:
+        raise _no_match_error(fmt, stri)
+    return keyvals
+
+
+@lru_cache()
+def _compile_regex(fmt, full_match=True):
+    """Get the compiled regular expression matching the format string *fmt*."""
     regex = regex_format(fmt)
     if full_match:
         regex = '^' + regex + '$'
-    match = re.match(regex, stri)
+    return re.compile(regex)
+
+
+def _match(regex, converters, stri):
+    """Parse *stri* with a compiled regular expression and (key, converter) pairs.
+
+    Returns:
+        dict or None: The parsed values, or None if *stri* doesn't match
+            *regex*. No exception is raised in the latter case, which keeps
+            filtering out non-matching strings cheap.
+
+    """
+    match = regex.match(stri)
     if match is None:
-        raise ValueError("String does not match pattern.")
-    return match.groupdict()
+        return None
+    keyvals = match.groupdict()
+    for key, converter in converters:
+        keyvals[key] = converter(keyvals[key])
+    return keyvals
+
+
+def _no_match_error(fmt, stri):
+    """Get the error to raise when *stri* doesn't match the format string *fmt*."""
+    return ValueError("String {!r} does not match pattern {!r}.".format(stri, fmt))
+
 
+# fixed time used to measure the width of datetime formats, so that the
+# (cached) result doesn't depend on when it was computed
+_WIDTH_REFERENCE_TIME = dt.datetime(2000, 1, 1, 1, 1, 1, 1)
 
+
+@lru_cache()
 def _get_number_from_fmt(fmt):
     """Helper function for extract_values.
 
@@ -389,39 +455,83 @@ def _get_number_from_fmt(fmt):
     """
     if '%' in fmt:
         # its datetime
-        return len(("{0:" + fmt + "}").format(dt.datetime.now()))
+        return len(_WIDTH_REFERENCE_TIME.strftime(fmt))
     else:
         # its something else
         fmt = fmt.lstrip('0')
-        return int(re.search('[0-9]+', fmt).group(0))
+        return int(digits_regex.search(fmt).group(0))
 
 
 def _convert(convdef, stri):
     """Convert the string *stri* to the given conversion definition *convdef*."""
+    return _get_converter(convdef)(stri)
+
+
+@lru_cache()
+def _get_converter(convdef):
+    """Get a function converting strings to the given conversion definition *convdef*.
+
+    All the inspection of *convdef* is done here, once, so that the returned
+    function only has to do the actual conversion.
+
+    """
     if '%' in convdef:
-        result = dt.datetime.strptime(stri, convdef)
+        return partial(_strptime, convdef)
+    if 'd' in convdef:
+        type_func = int
+    elif 'x' in convdef or 'X' in convdef:
+        type_func = partial(int, base=16)
+    elif 'o' in convdef:
+        type_func = partial(int, base=8)
+    elif 'b' in convdef:
+        type_func = partial(int, base=2)
+    elif any(float_type_marker in convdef for float_type_marker in fixed_point_types):
+        type_func = float
     else:
-        result = _strip_padding(convdef, stri)
-        if 'd' in convdef:
-            result = int(result)
-        elif 'x' in convdef or 'X' in convdef:
-            result = int(result, 16)
-        elif 'o' in convdef:
-            result = int(result, 8)
-        elif 'b' in convdef:
-            result = int(result, 2)
-        elif any(float_type_marker in convdef for float_type_marker in fixed_point_types):
-            result = float(result)
+        type_func = str
+    strip_func, pad = _get_padding_def(convdef)
+    if strip_func is None:
+        return type_func
+    return partial(_strip_and_convert, type_func, strip_func, pad)
 
-    return result
 
+@lru_cache(maxsize=4096)
+def _strptime(convdef, stri):
+    """Convert *stri* to a datetime object according to *convdef*.
 
-def _strip_padding(convdef, stri):
-    """Strip padding from the given string.
+    File names often share the same dates, so the results are kept in a
+    bounded, thread-safe cache. This is fine as datetime objects are immutable.
 
-    Args:
-        convdef: Conversion definition (indicates the padding)
-        stri: String to be modified
+    """
+    return dt.datetime.strptime(stri, convdef)
+
+
+def _strip_and_convert(type_func, strip_func, pad, stri):
+    """Strip padding *pad* from *stri* with *strip_func* and convert it with *type_func*."""
+    return type_func(strip_func(stri, pad))
+
+
+@lru_cache()
+def _get_converters(fmt):
+    """Get (key, converter function) pairs for the fields in *fmt* needing a conversion.
+
+    Plain string fields without padding are left out, as the matched strings
+    can be used as they are.
+
+    """
+    converters = ((key, _get_converter(convdef)) for key, convdef in get_convert_dict(fmt).items())
+    return tuple((key, converter) for key, converter in converters if converter is not str)
+
+
+_STRIP_FUNCS = {'>': str.lstrip, '<': str.rstrip, '^': str.strip}
+
+
+def _get_padding_def(convdef):
+    """Get the function and characters needed to strip padding as defined in *convdef*.
+
+    Returns:
+        tuple: The string method to strip the padding with (None if there is
+            no padding) and the padding character.
     """
     regex_match = fmt_spec_regex.match(convdef)
     match_dict = regex_match.groupdict() if regex_match else {}
@@ -432,13 +542,7 @@ def _strip_padding(convdef, stri):
         align = align[-1]
     if align and align in '<>^' and not pad:
         pad = ' '
-    if align == '>':
-        stri = stri.lstrip(pad)
-    elif align == '<':
-        stri = stri.rstrip(pad)
-    elif align == '^':
-        stri = stri.strip(pad)
-    return stri
+    return _STRIP_FUNCS.get(align), pad
 
 @lru_cache()
 def get_convert_dict(fmt):
@@ -462,11 +566,9 @@ def parse(fmt, stri, full_match=True):
             True.
 
     """
-    convdef = get_convert_dict(fmt)
-    keyvals = extract_values(fmt, stri, full_match=full_match)
-    for key in convdef.keys():
-        keyvals[key] = _convert(convdef[key], keyvals[key])
-
+    keyvals = _match(_compile_regex(fmt, full_match), _get_converters(fmt), stri)
+    if keyvals is None:
+        raise _no_match_error(fmt, stri)
     return keyvals
 
 
@@ -519,6 +621,32 @@ DT_FMT = {
 }
 
 
+def _dt_fmt_to_regex(fmt_val):
+    """Convert a glob pattern from `DT_FMT` to a regular expression."""
+    count = fmt_val.count('?')
+    # either a series of numbers or letters/numbers
+    return r'\d{{{:d}}}'.format(count) if count else r'[^ \t\n\r\f\v\-_:]+'
+
+
+DT_REGEX = {fmt_key: _dt_fmt_to_regex(fmt_val)
+            for fmt_key, fmt_val in DT_FMT.items() if fmt_key != '%%'}
+# special case: an escaped '%' is a literal '%'
+DT_REGEX['%%'] = '%'
+dt_directive_regex = re.compile('%.')
+
+
+def _dt_directive_to_regex(match):
+    """Get the regular expression for a datetime directive matched by `dt_directive_regex`."""
+    directive = match.group()
+    return DT_REGEX.get(directive, directive)
+
+
+def _dt_directive_to_glob(match):
+    """Get the glob pattern for a datetime directive matched by `dt_directive_regex`."""
+    directive = match.group()
+    return DT_FMT.get(directive, directive)
+
+
 class GlobifyFormatter(string.Formatter):
 
     # special string to mark a parameter not being specified
@@ -547,11 +675,8 @@ class GlobifyFormatter(string.Formatter):
         if not format_spec:
             return '*'
         if '%' in format_spec:
-            replace_str = format_spec
-            for fmt_key, fmt_val in DT_FMT.items():
-                replace_str = replace_str.replace(fmt_key, fmt_val)
-            return replace_str
-        if not re.search('[0-9]+', format_spec):
+            return dt_directive_regex.sub(_dt_directive_to_glob, format_spec)
+        if not digits_regex.search(format_spec):
             # non-integer type
             return '*'
         return '?' * _get_number_from_fmt(format_spec)
@@ -569,16 +694,30 @@ def globify(fmt, keyvals=None):
     return globify_formatter.format(fmt, **keyvals)
 
 
-def validate(fmt, stri):
+def validate(fmt, stri, strict=True):
     """
     Validates that string *stri* is parsable and therefore complies with
     the format string, *fmt*.  Useful for filtering string, or to
     check if string if compatible before passing the string to the
     parser function.
+
+    If *strict* is False, only the structure of *stri* is checked and
+    the values are not converted (e.g. to datetime objects), which is faster.
     """
     try:
-        parse(fmt, stri)
-        return True
+        regex = _compile_regex(fmt, True)
+        converters = _get_converters(fmt)
+    except ValueError:
+        return False
+    return _validate_with_def(regex, converters, stri, strict=strict)
+
+
+def _validate_with_def(regex, converters, stri, strict=True):
+    """Check *stri* against a compiled regular expression and (key, converter) pairs."""
+    if not strict:
+        return regex.match(stri) is not None
+    try:
+        return _match(regex, converters, stri) is not None
     except ValueError:
         return False
 
@@ -680,12 +819,55 @@ def purge():
 
     """
     regex_format.cache_clear()
+    _compile_regex.cache_clear()
+    _get_converters.cache_clear()
+    _get_converter.cache_clear()
+    _strptime.cache_clear()
+    _get_compose_parts.cache_clear()
     get_convert_dict.cache_clear()
+    _get_number_from_fmt.cache_clear()
 
 
 def _strict_compose(fmt, keyvals):
     """Convert parameters in `keyvals` to a string based on `fmt` string."""
-    return formatter.format(fmt, **keyvals)
+    parts = _get_compose_parts(fmt)
+    if parts is None or type(keyvals) is not dict:
+        # other mappings could e.g. define __missing__, which must not be
+        # used as keyvals are unpacked into a plain dict here
+        return formatter.format(fmt, **keyvals)
+    result = []
+    for literal_text, field_name, format_spec, conversion in parts:
+        result.append(literal_text)
+        if field_name is None:
+            continue
+        if field_name.isidentifier():
+            value = keyvals[field_name]
+        else:
+            value = formatter.get_field(field_name, (), keyvals)[0]
+        if conversion is not None:
+            value = formatter.convert_field(value, conversion)
+        if format_spec and type(value) is dt.datetime:
+            result.append(value.strftime(format_spec))
+        else:
+            result.append(format(value, format_spec))
+    return ''.join(result)
+
+
+@lru_cache()
+def _get_compose_parts(fmt):
+    """Get the parsed `fmt` string to compose, or None if it needs the full formatter.
+
+    The full formatter is needed for positional fields and for format
+    specifications with nested fields.
+
+    """
+    parts = tuple(formatter.parse(fmt))
+    for literal_text, field_name, format_spec, conversion in parts:
+        if field_name is None:
+            continue
+        if not field_name or field_name[0].isdigit() or '{' in format_spec:
+            return None
+    return parts
 
 
 def _partial_compose(fmt, keyvals):
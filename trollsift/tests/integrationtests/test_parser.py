@@ -40,16 +40,36 @@ class TestParser(unittest.TestCase):
         # Assert
         self.assertDictEqual(result, self.data)
 
+    def test_parse_many(self):
+        string2 = "/somedir/avhrr/hrpt_noaa19_20140212_1412_12345.l1b"
+        data2 = {'directory': 'avhrr', 'platform': 'noaa', 'platnum': '19',
+                 'time': dt.datetime(2014, 2, 12, 14, 12), 'orbit': 12345}
+        # Run
+        result = self.p.parse_many([self.string, string2])
+        # Assert
+        self.assertItemsEqual(result, [self.data, data2])
+        result = self.p.parse_many(iter([self.string, string2]), columnar=True)
+        self.assertDictEqual(result, {key: [self.data[key], data2[key]] for key in self.data})
+        self.assertRaises(ValueError, self.p.parse_many, [self.string, "bad_string"])
+
     def test_cache_clear(self):
         """Test we can clear the internal cache properly"""
-        from trollsift.parser import purge, regex_format
+        from trollsift.parser import purge, regex_format, _compile_regex
+        from trollsift.parser import _get_converters, _get_converter, _strptime, _get_number_from_fmt
+        from trollsift.parser import _get_compose_parts
+        caches = [regex_format, _compile_regex, _get_converters, _get_converter, _strptime,
+                  _get_number_from_fmt, _get_compose_parts]
         # Run
         result = self.p.parse(self.string)
+        self.p.globify()
+        self.p.compose(self.data)
         # Assert
         self.assertDictEqual(result, self.data)
-        assert regex_format.cache_info()[-1] != 0
+        for cache in caches:
+            assert cache.cache_info().currsize != 0
         purge()
-        assert regex_format.cache_info()[-1] == 0
+        for cache in caches:
+            assert cache.cache_info().currsize == 0
 
     def test_compose(self):
         # Run
@@ -57,6 +77,21 @@ class TestParser(unittest.TestCase):
         # Assert
         self.assertEqual(result, self.string)
 
+    def test_compose_only_format(self):
+        """Test that a format that can't be parsed can still be composed."""
+        p = Parser("{platform!u}_{orbit:05d}")
+        self.assertEqual(p.compose({'platform': 'noaa', 'orbit': 22}), 'NOAA_00022')
+        self.assertRaises(ValueError, p.parse, 'NOAA_00022')
+
+    def test_fmt_change(self):
+        """Test that changing the format string of a parser is taken into account."""
+        p = Parser("{a}_{b:d}")
+        self.assertDictEqual(p.parse("x_1"), {'a': 'x', 'b': 1})
+        p.fmt = "{a}-{b:d}"
+        self.assertEqual(p.compose({'a': 'x', 'b': 1}), 'x-1')
+        self.assertDictEqual(p.parse("x-1"), {'a': 'x', 'b': 1})
+        self.assertTrue(p.validate("x-1"))
+
     def test_validate(self):
         # These cases are True
         self.assertTrue(
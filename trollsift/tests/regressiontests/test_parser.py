@@ -31,3 +31,12 @@ class TestParser(unittest.TestCase):
         self.assertEqual(res, {'orbit_number': 29889,
                                'satellite': 'NOAA-19',
                                'start_time': dt.datetime(2014, 11, 26, 10, 12)})
+
+    def test_003(self):
+        """Test that repeated literal separators don't cut fields short."""
+        res = parse('{directory}/hrpt_{start_time:%Y%m%d}/{filename}.{ext}',
+                    "/data/hrpt_noaa/hrpt_20141126/sub/dir/file.tar.gz")
+        self.assertEqual(res, {'directory': '/data/hrpt_noaa',
+                               'start_time': dt.datetime(2014, 11, 26),
+                               'filename': 'sub/dir/file',
+                               'ext': 'tar.gz'})
@@ -1,9 +1,10 @@
 import unittest
 import datetime as dt
+from collections import defaultdict
 import pytest
 
 from trollsift.parser import get_convert_dict, extract_values
-from trollsift.parser import _convert
+from trollsift.parser import _convert, _get_converters, _get_number_from_fmt, _get_compose_parts
 from trollsift.parser import parse, globify, validate, is_one2one, compose, Parser
 
 
@@ -102,7 +103,8 @@ class TestParser(unittest.TestCase):
 
     def test_extract_values_fails(self):
         fmt = '/somedir/{directory}/hrpt_{platform:4s}{platnum:2s}_{time:%Y%m%d_%H%M}_{orbit:4d}.l1b'
-        self.assertRaises(ValueError, extract_values, fmt, self.string)
+        with pytest.raises(ValueError, match="does not match pattern"):
+            extract_values(fmt, self.string)
 
     def test_extract_values_full_match(self):
         """Test that a string must completely match."""
@@ -122,6 +124,14 @@ class TestParser(unittest.TestCase):
         self.assertEqual(_convert('%Y%m%d_%H%M', '20140210_1004'),
                          dt.datetime(2014, 2, 10, 10, 4))
 
+    def test_get_converters(self):
+        converters = dict(_get_converters(self.fmt))
+        # plain strings need no conversion
+        self.assertEqual(converters.keys(), {'time', 'orbit'})
+        self.assertEqual(converters['orbit']('00022'), 22)
+        self.assertEqual(converters['time']('20140210_1004'),
+                         dt.datetime(2014, 2, 10, 10, 4))
+
     def test_parse(self):
         # Run
         result = parse(
@@ -145,6 +155,14 @@ class TestParser(unittest.TestCase):
         self.assertEqual(expected_result["bar"], "qux")
         self.assertEqual(result, expected_result)
 
+    def test_parse_escaped_percent(self):
+        """Test that an escaped '%' in a datetime format matches a literal '%'."""
+        result = parse("{time:%Y%m%d%%}_{orbit:05d}", "20140212%_12345")
+        self.assertDictEqual(result, {'time': dt.datetime(2014, 2, 12),
+                                      'orbit': 12345})
+        result = parse("{time:%Y%m%%d}", "201402%d")
+        self.assertDictEqual(result, {'time': dt.datetime(2014, 2, 1)})
+
     def test_parse_wildcards(self):
         # Run
         result = parse(
@@ -257,6 +275,17 @@ class TestParser(unittest.TestCase):
         # Assert
         self.assertEqual(result, 'hrpt_noaa??_????????_????_*.l1b')
 
+    def test_globify_datetime_escaped_percent(self):
+        result = globify('{time:%Y%m%%d}_{orbit}.l1b')
+        self.assertEqual(result, '???????d_*.l1b')
+
+    def test_get_number_from_fmt(self):
+        self.assertEqual(_get_number_from_fmt('05d'), 5)
+        self.assertEqual(_get_number_from_fmt('%Y%m%d_%H%M'), 13)
+        # variable length directives are measured against a fixed time
+        self.assertEqual(_get_number_from_fmt('%B'), len('January'))
+        self.assertEqual(_get_number_from_fmt('%A'), len('Saturday'))
+
     def test_validate(self):
         # These cases are True
         self.assertTrue(
@@ -283,6 +312,15 @@ class TestParser(unittest.TestCase):
         self.assertFalse(
             validate(self.fmt, "{}/somedir/bla/bla/hrpt_noaa19_20140212_1412_00000.l1b"))
 
+    def test_validate_not_strict(self):
+        # Structure is fine, but the date is invalid
+        stri = "/somedir/avhrr/2014/hrpt_noaa19_20141312_1412_12345.l1b"
+        self.assertFalse(validate(self.fmt, stri))
+        self.assertTrue(validate(self.fmt, stri, strict=False))
+        self.assertFalse(
+            validate(self.fmt, "/somedir/bla/bla/hrpt_noaa19_20140212_1412_00000", strict=False))
+        self.assertFalse(validate("{platnum:-=2s}", "19"))
+
     def test_is_one2one(self):
         # These cases are True
         self.assertTrue(is_one2one(
@@ -346,6 +384,29 @@ class TestCompose:
             new_str = compose("{a!X}", key_vals, allow_partial=allow_partial)
         assert new_str == "this Is A-Test b_test c test"
 
+    def test_compose_field_lookups(self):
+        """Test composing with indexed, attribute and datetime fields."""
+        fmt = "{a[1]}_{c.year}_{c:%Y%m%d_%H%M}_{c}"
+        keyvals = {"a": [3, 4], "c": dt.datetime(2014, 2, 10, 10, 4)}
+        assert _get_compose_parts(fmt) is not None
+        assert compose(fmt, keyvals) == "4_2014_20140210_1004_2014-02-10 10:04:00"
+
+    def test_compose_nested_spec(self):
+        """Test composing with a field nested in a format spec."""
+        fmt = "{b:{a[0]}d}"
+        assert _get_compose_parts(fmt) is None
+        assert compose(fmt, {"a": [3, 4], "b": 2}) == "  2"
+
+    def test_compose_missing_key_in_mapping_with_default(self):
+        """Test that a mapping providing defaults for missing keys isn't used for them."""
+        keyvals = defaultdict(str, {"a": "foo"})
+        with pytest.raises(KeyError):
+            compose("{a}_{b}", keyvals)
+        with pytest.raises(KeyError):
+            compose("{a}_{b[0]}", keyvals)
+        assert dict(keyvals) == {"a": "foo"}
+        assert compose("{a}", keyvals) == "foo"
+
     def test_default_compose_is_strict(self):
         """Make sure the default compose call does not accept partial composition."""
         fmt = "{foo}_{bar}.qux"